@@ -30,12 +30,10 @@ from .min import (
 
 # Constants for implementation status
 from .core import (
-    IMPLEMENTED, 
-    PARTIAL, 
-    PLANNED, 
+    IMPLEMENTED,
+    PARTIAL,
+    PLANNED,
     NOT_IMPLEMENTED,
-    AUTOMATION_READY,
-    REQUIRES_JUDGMENT,
     DEPRECATED
 )
 
@@ -55,7 +53,5 @@ __all__ = [
     'PARTIAL', 
     'PLANNED', 
     'NOT_IMPLEMENTED',
-    'AUTOMATION_READY',
-    'REQUIRES_JUDGMENT',
     'DEPRECATED'
 ]
@@ -9,9 +9,9 @@ Focus only on the annotations in the user's code, not on how they're implemented
 import inspect
 import threading
 import datetime
-from enum import Enum
+from enum import IntEnum
 from typing import NamedTuple, Any, Dict, Optional, List, Type, Callable, Union
-from .runtime import _current_system, DISABLED, resolve_concept
+from .runtime import _current_system, DISABLED, resolve_concept, SourceInfo
 
 
 class COPError(Exception):
@@ -42,8 +42,12 @@ class COPAnnotationData(NamedTuple):
 
 
 # Implementation status constants
-class ImplementationStatusValues(Enum):
-    """Status constants - ordered from most to least complete."""
+class ImplementationStatusValues(IntEnum):
+    """Status constants - ordered from most to least complete.
+
+    An IntEnum so status comparisons in verification loops are plain
+    integer compares rather than generic enum equality.
+    """
     IMPLEMENTED = 5       # ✅ Fully functional and complete
     PARTIAL = 4           # ⚠️ Partially working with limitations
     BUGGY = 3             # ❌ Was working but now has issues
@@ -95,9 +99,9 @@ class DefaultNamespace:
 class COPNamespace(DefaultNamespace):
     """Enhanced namespace for COP annotations with mapping support."""
     
-    def __init__(self):
+    def __init__(self, **kwargs):
         """Initialize with empty lists as defaults."""
-        super().__init__(default_factory=list)
+        super().__init__(default_factory=list, **kwargs)
     
     def __getitem__(self, key):
         """Support dictionary-style access."""
@@ -112,7 +116,7 @@ class COPNamespace(DefaultNamespace):
     
     def __contains__(self, key):
         """Check if an annotation type exists."""
-        return hasattr(self, key) and (not key.startswith('_')
+        return hasattr(self, key) and not key.startswith('_')
 
     def get(self, key):
         return self.__getattr__(key)
@@ -144,10 +148,14 @@ class COPNamespace(DefaultNamespace):
 
 class COPAnnotation:
     """Base class for all COP annotations."""
-    
+
+    # Annotations are created in bulk on annotation-heavy codebases, so
+    # avoid a per-instance __dict__ (subclasses declare empty __slots__).
+    __slots__ = ("args", "kwargs", "_source_info")
+
     # Define class attribute for polymorphic behavior
     kind = "annotation"  # Override in subclasses
-    
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the annotation with provided arguments.
@@ -157,9 +165,9 @@ class COPAnnotation:
             **kwargs: Keyword arguments
         """
         # Quick return if disabled
-        if _cop_system.mode is DISABLED:
+        if _current_system is DISABLED or not _current_system.is_enabled():
             return
-            
+
         self.args = args
         self.kwargs = kwargs
         self._source_info = _current_system.get_source_info(skip_frames=3)
@@ -183,8 +191,23 @@ class COPAnnotation:
         # Initialize annotations namespace if needed
         if not hasattr(obj, "__cop_annotations__"):
             setattr(obj, "__cop_annotations__", COPNamespace())
+        annotation_data = self._create_annotation_data()
         annotations = getattr(obj, "__cop_annotations__").get(self.kind)
         annotations.append(annotation_data)
+        # Maintain a per-kind value set so membership checks can be a
+        # hash lookup instead of a scan over the annotation list
+        index = getattr(obj, "__cop_annotation_values__", None)
+        if index is None:
+            index = {}
+            setattr(obj, "__cop_annotation_values__", index)
+        values = index.setdefault(self.kind, set())
+        if values is not None:
+            try:
+                values.add(annotation_data.value)
+            except TypeError:
+                # Unhashable value poisons the index for this kind;
+                # lookups fall back to scanning the list
+                index[self.kind] = None
     
     def __call__(self, obj):
         """
@@ -254,6 +277,8 @@ class COPAnnotation:
 
 
 class COPSingletonAnnotation(COPAnnotation):
+    __slots__ = ()
+
     def _register_annotation(self, obj):
         annotations = getattr(obj, "__cop_annotations__").get(self.kind)
         if len(annotations) > 0:
@@ -278,6 +303,7 @@ class intent(COPSingletonAnnotation):
             tax = calculate_tax(amount, location)
     """
     kind = "intent"
+    __slots__ = ()
     
     def __init__(self, description: str):
         """
@@ -328,6 +354,7 @@ class implementation_status(COPSingletonAnnotation):
             raise NotImplementedError()
     """
     kind = "implementation_status"
+    __slots__ = ()
     
     def __init__(self, status, details: Optional[str]=None, alternative: Optional[str]=None):
         """
@@ -374,6 +401,7 @@ class invariant(COPAnnotation):
             result = db.execute(query)
     """
     kind = "invariant"
+    __slots__ = ()
     
     def __init__(self, condition: str, critical: bool=False, scope: str="always"):
         """
@@ -419,6 +447,7 @@ class risk(COPAnnotation):
             temp_buffer = allocate_large_buffer()
     """
     kind = "risk"
+    __slots__ = ()
     
     def __init__(self, description: str, category: str="security", severity: str="MEDIUM", 
                 impact: Optional[str]=None, mitigation: Optional[Union[str, List[str]]]=None):
@@ -481,6 +510,7 @@ class decision(COPAnnotation):
             # This section requires human implementation
     """
     kind = "decision"
+    __slots__ = ()
 
     def __init__(self, 
                  # Short and optional longer decision description
@@ -589,3 +619,6 @@ DEPRECATED = ImplementationStatusValues.DEPRECATED           # 🚫 Exists but s
 PLANNED = ImplementationStatusValues.PLANNED                 # 📝 Designed but not implemented
 NOT_IMPLEMENTED = ImplementationStatusValues.NOT_IMPLEMENTED # ❓ Does not exist at all
 UNKNOWN = ImplementationStatusValues.UNKNOWN                 # ❔ Status not yet evaluated
+
+# Single-lookup bundle of the status constants for re-exporting modules
+_STATUS_TUPLE = (IMPLEMENTED, PARTIAL, PLANNED, NOT_IMPLEMENTED, BUGGY, DEPRECATED)
@@ -73,3 +73,35 @@ from .core import (
     NOT_IMPLEMENTED,     # ❓ Does not exist at all
     UNKNOWN,             # ❔ Status not yet evaluated
 )
+
+
+# Convenience presets for the most common annotation idioms, matching
+# the examples used throughout the documentation above.
+
+def human_decision(*args, **kwargs):
+    """@decision preset: implementation reserved for a human."""
+    kwargs.setdefault("implementor", "human")
+    return decision(*args, **kwargs)
+
+
+def security_risk(description, **kwargs):
+    """@risk preset: category fixed to security."""
+    kwargs.setdefault("category", "security")
+    return risk(description, **kwargs)
+
+
+def critical_invariant(condition, **kwargs):
+    """@invariant preset: critical fixed to True."""
+    kwargs["critical"] = True
+    return invariant(condition, **kwargs)
+
+
+def mark_unimplemented(details=None):
+    """@implementation_status preset: component does not exist yet."""
+    return implementation_status(NOT_IMPLEMENTED, details=details)
+
+
+def mark_security_critical(description, **kwargs):
+    """@risk preset: security risk at CRITICAL severity."""
+    kwargs.setdefault("severity", "CRITICAL")
+    return security_risk(description, **kwargs)
@@ -1,8 +1,9 @@
+import functools
 import importlib
 import inspect
 import threading
 import datetime
-from typing import Any, Dict, List, Optional, Union, NamedTuple
+from typing import Any, Dict, List, Optional, Tuple, Union, NamedTuple
 
 
 class SourceInfo(NamedTuple):
@@ -89,20 +90,35 @@ class NoOpCOPSystem(COPSystem):
 
 
 class StandardCOPSystem(COPSystem):
+    def is_enabled(self) -> bool:
+        """Check if the system is enabled."""
+        return True
+
+    def is_tracing(self) -> bool:
+        """Check if the system is tracing source positions."""
+        return False
+
+    def get_source_info(self, skip_frames: int = 1) -> Optional[SourceInfo]:
+        """Source info is only collected by the tracing system."""
+        return None
+
     def __init__(self):
         """Initialize the COP system."""
-        # Thread-local COPNamespace to store all contexts
+        # Thread-local storage for the per-thread context namespace;
+        # the namespace itself is created lazily in the contexts
+        # property (a fresh threading.local never has the attribute)
         self.thread_contexts = threading.local()
-        # Initialize empty namespace on first access
-        if not hasattr(self.thread_contexts, "contexts"):
-            self.thread_contexts.contexts = COPNamespace()
-    
+
     @property
     def contexts(self):
         """Access the context namespace, initializing if needed."""
-        if not hasattr(self.thread_contexts, "contexts"):
-            self.thread_contexts.contexts = COPNamespace()
-        return self.thread_contexts.contexts
+        contexts = getattr(self.thread_contexts, "contexts", None)
+        if contexts is None:
+            # Imported here: core imports this module at its top level,
+            # so the namespace class can only be pulled in at call time
+            from .core import COPNamespace
+            contexts = self.thread_contexts.contexts = COPNamespace()
+        return contexts
     
     def push_context(self, context_type: str, context: Any) -> None:
         """Push a context to its stack."""
@@ -131,16 +147,17 @@ class StandardCOPSystem(COPSystem):
             Dict mapping context types to their most recent context
         """
         current_contexts = {}
-        
-        # Iterate through all attributes of the namespace
-        for attr_name in dir(self.contexts):
+
+        # Walk the instance __dict__ directly: dir() built a sorted
+        # list that also included class attributes, all of which the
+        # filter discarded, and each name cost a getattr afterwards
+        for attr_name, stack in self.contexts.__dict__.items():
             if attr_name.startswith('_'):
                 continue
-                
-            stack = getattr(self.contexts, attr_name)
+
             if stack:  # Only include non-empty stacks
                 current_contexts[attr_name] = stack[-1]
-                
+
         return current_contexts
         
 
@@ -204,11 +221,10 @@ class TracingCOPSystem(StandardCOPSystem):
         """Pop a context from its stack with tracing."""
         stack_name = f"{context_type}_stack"
         context = None
-        
-        if hasattr(self.contexts, stack_name):
-            stack = getattr(self.contexts, stack_name)
-            if stack:
-                context = stack[-1]  # Get the context before popping
+
+        stack = getattr(self.contexts, stack_name, None)
+        if stack:
+            context = stack[-1]  # Get the context before popping
         
         super().pop_context(context_type)
         
@@ -217,8 +233,8 @@ class TracingCOPSystem(StandardCOPSystem):
             source_info = self.get_source_info(skip_frames=2)  # Skip pop_context and caller
             self._add_trace("exit_context", context_type, context, source_info)
     
-        def _add_trace(self, action: str, annotation_type: str, 
-                  annotation: Any, source_info: SourceInfo) -> None:
+    def _add_trace(self, action: str, annotation_type: str,
+                   annotation: Any, source_info: SourceInfo) -> None:
         """
         Add a trace entry.
         
@@ -320,27 +336,38 @@ def resolve_concept(concept: Union[Any, str],
     # If concept is already an object (not a string), return it directly
     if not isinstance(concept, str):
         return concept
-    
+
     try:
         # Handle relative imports with base_module
         if base_module and '.' not in concept:
             full_path = f"{base_module}.{concept}"
         else:
             full_path = concept
-        
-        # Split into module path and attribute name
-        if '.' in full_path:
-            module_path, attr_name = full_path.rsplit('.', 1)
-            
-            # Import the module
-            module = importlib.import_module(module_path)
-            
-            # Get the attribute from the module
-            resolved = getattr(module, attr_name)
-            return resolved
-        else:
-            # It's just a module name
-            return importlib.import_module(full_path)
-            
+
+        return _resolve_concept_path(full_path)
+
     except (ImportError, AttributeError, ValueError) as e:
         raise ValueError(f"Could not resolve concept path '{concept}': {e}")
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_concept_path(full_path: str) -> Any:
+    """Resolve a dotted path, memoized per path.
+
+    The same paths get resolved over and over across a test run; caching
+    skips the repeated import-machinery walk and attribute fetch. Failed
+    resolutions are not cached (lru_cache does not store exceptions), so
+    a path that becomes importable later still resolves.
+    """
+    # Split into module path and attribute name
+    if '.' in full_path:
+        module_path, attr_name = full_path.rsplit('.', 1)
+
+        # Import the module
+        module = importlib.import_module(module_path)
+
+        # Get the attribute from the module
+        return getattr(module, attr_name)
+
+    # It's just a module name
+    return importlib.import_module(full_path)
@@ -88,9 +88,10 @@ from .annotations import (
 from .assertions import (
     # Invariant assertions
     assert_invariant,
+    assert_invariant_batch,
     assert_maintained,
     assert_violation_raises,
-    
+
     # Security risk assertions
     assert_security_requirement,
     assert_mitigated,
@@ -110,25 +111,41 @@ from .assertions import (
     assert_achieves_goal
 )
 
-# Re-export verification tools
-from .verification import (
-    check_component_test_coverage,
-    generate_verification_report
-)
+# Verification tools and the pytest integration are re-exported
+# lazily below (PEP 562): they are only needed for report generation,
+# so importing this package stays cheap for the assertion hot path.
 
-# Re-export implementation status constants
-from ..core import (
-    # Implementation states
+# Re-export implementation status constants (one lookup + one unpack)
+from ..core import _STATUS_TUPLE
+(
     IMPLEMENTED,         # ✅ Fully functional and complete
     PARTIAL,             # ⚠️ Partially working with limitations
     PLANNED,             # 📝 Designed but not implemented
     NOT_IMPLEMENTED,     # ❓ Does not exist at all
     BUGGY,               # ❌ Was working but now has issues
     DEPRECATED           # 🚫 Exists but should not be used
-)
+) = _STATUS_TUPLE
+
+# Lazily resolved re-exports. First access imports the target module
+# and caches the object in this module's globals, so every later
+# lookup takes the normal C-level module-attribute path.
+_LAZY_EXPORTS = {
+    'check_component_test_coverage': ('.verification', 'check_component_test_coverage'),
+    'generate_verification_report': ('.verification', 'generate_verification_report'),
+    'pytest_plugin': ('.pytest_plugin', None),
+}
+
+
+def __getattr__(name):
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    module = import_module(target[0], __name__)
+    obj = module if target[1] is None else getattr(module, target[1])
+    globals()[name] = obj
+    return obj
 
-# Export pytest plugin for auto-discovery
-from .integration import pytest_plugin
 
 # Define what is exported
 __all__ = [
@@ -140,7 +157,8 @@ __all__ = [
     'DecisionViolation', 'IntentViolation',
     
     # Invariant assertions
-    'assert_invariant', 'assert_maintained', 'assert_violation_raises',
+    'assert_invariant', 'assert_invariant_batch', 'assert_maintained',
+    'assert_violation_raises',
     
     # Security risk assertions
     'assert_security_requirement', 'assert_mitigated', 'assert_prevented', 'assert_sanitized',
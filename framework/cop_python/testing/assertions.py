@@ -5,6 +5,7 @@ These are standalone versions of the assertion methods available
 through the enhanced annotation classes.
 """
 
+import functools
 from typing import Any, Optional, Dict, Type, Callable
 
 # Re-export the exception classes
@@ -15,6 +16,49 @@ from .annotations import (
     DecisionViolation,
     IntentViolation
 )
+from .annotations import _component_name
+
+# The testing-enhanced annotation classes these wrappers delegate to.
+# annotations.py imports nothing from this module, so a plain top-level
+# import is safe and avoids re-running the import machinery on every
+# assertion call.
+from .annotations import (
+    intent,
+    invariant,
+    implementation_status,
+    risk,
+    decision
+)
+
+# Pre-bound assertion entry points. Binding the classmethods once at
+# import turns each delegation below into a single global load plus a
+# call, with no per-call attribute lookup or method binding.
+_invariant_assertion = invariant.assertion
+_invariant_maintained = invariant.assert_maintained
+_invariant_violation_raises = invariant.assert_violation_raises
+_risk_assertion = risk.assertion
+_risk_mitigated = risk.assert_mitigated
+_risk_prevented = risk.assert_prevented
+_risk_sanitized = risk.assert_sanitized
+_status_matches = implementation_status.assert_matches
+_status_completeness = implementation_status.assert_completeness
+_decision_followed = decision.assert_followed
+_decision_constraints_met = decision.assert_constraints_met
+_intent_fulfilled = intent.assert_fulfilled
+_intent_achieves_goal = intent.assert_achieves_goal
+
+@functools.lru_cache(maxsize=1024)
+def _format_failure(message: str, component_name: Optional[str]) -> str:
+    """Format a failure message, memoized per (message, component).
+
+    Retry/fuzz-style runs can hit the same failure thousands of times;
+    caching skips the repeated f-string build. Only the component name
+    is used as a key so arbitrary components never get hashed.
+    """
+    if component_name is None:
+        return message
+    return f"{message} (on {component_name})"
+
 
 #---------------------- Invariant Assertions ----------------------#
 
@@ -29,8 +73,32 @@ def assert_invariant(condition: bool, message: Optional[str] = None, *, on: Any
         message: Optional message or specific invariant to check
         on: Optional component to validate against
     """
-    from .annotations import invariant
-    invariant.assertion(condition, message, on=on)
+    if condition:
+        return  # Fast path: no import or delegation on success
+    _invariant_assertion(condition, message, on=on)
+
+
+def assert_invariant_batch(items, *, on: Any = None) -> None:
+    """
+    Assert a batch of invariant conditions in one call.
+
+    Amortizes the per-call overhead of assert_invariant when a test
+    checks many conditions; only the first failing condition raises.
+
+    Args:
+        items: Iterable of (condition, message) pairs
+        on: Optional component to validate against
+
+    Example:
+        assert_invariant_batch(
+            (balance >= 0, f"Balance non-negative for {account}")
+            for account, balance in ledger.items()
+        )
+    """
+    for condition, message in items:
+        if not condition:
+            name = _component_name(on) if on is not None else None
+            raise InvariantViolation(_format_failure(message, name))
 
 
 def assert_maintained(condition: bool, invariant_description: str, *, on: Any = None) -> None:
@@ -44,8 +112,9 @@ def assert_maintained(condition: bool, invariant_description: str, *, on: Any =
         invariant_description: Description of the invariant
         on: Optional component to validate against
     """
-    from .annotations import invariant
-    invariant.assert_maintained(condition, invariant_description, on=on)
+    if condition:
+        return
+    _invariant_maintained(condition, invariant_description, on=on)
 
 
 def assert_violation_raises(expected_exception: Type[Exception], 
@@ -67,11 +136,10 @@ def assert_violation_raises(expected_exception: Type[Exception],
     Raises:
         AssertionError: If the callable doesn't raise the expected exception
     """
-    from .annotations import invariant
-    invariant.assert_violation_raises(expected_exception, callable_obj, 
-                                     *args, 
-                                     invariant_description=invariant_description, 
-                                     **kwargs)
+    _invariant_violation_raises(expected_exception, callable_obj,
+                                *args,
+                                invariant_description=invariant_description,
+                                **kwargs)
 
 
 #---------------------- Security Risk Assertions ----------------------#
@@ -87,8 +155,9 @@ def assert_security_requirement(condition: bool, message: Optional[str] = None,
         message: Optional message or specific risk to check
         on: Optional component to validate against
     """
-    from .annotations import risk
-    risk.assertion(condition, message, on=on)
+    if condition:
+        return
+    _risk_assertion(condition, message, on=on)
 
 
 def assert_mitigated(condition: bool, risk_description: str, *, on: Any = None) -> None:
@@ -102,8 +171,9 @@ def assert_mitigated(condition: bool, risk_description: str, *, on: Any = None)
         risk_description: Description of the risk
         on: Optional component to validate against
     """
-    from .annotations import risk
-    risk.assert_mitigated(condition, risk_description, on=on)
+    if condition:
+        return
+    _risk_mitigated(condition, risk_description, on=on)
 
 
 def assert_prevented(attack_function: Callable, 
@@ -123,8 +193,7 @@ def assert_prevented(attack_function: Callable,
     Raises:
         AssertionError: If the attack function succeeds
     """
-    from .annotations import risk
-    risk.assert_prevented(attack_function, *args, risk_description=risk_description, **kwargs)
+    _risk_prevented(attack_function, *args, risk_description=risk_description, **kwargs)
 
 
 def assert_sanitized(value: Any, 
@@ -143,8 +212,7 @@ def assert_sanitized(value: Any,
         risk_description: Description of the risk
         on: Optional component to validate against
     """
-    from .annotations import risk
-    risk.assert_sanitized(value, sanitizer, risk_description, on=on)
+    _risk_sanitized(value, sanitizer, risk_description, on=on)
 
 
 #---------------------- Implementation Status Assertions ----------------------#
@@ -159,8 +227,7 @@ def assert_implementation_matches_status(component: Any, behavior_success: bool)
         component: The component to check
         behavior_success: Whether the behavior was successful
     """
-    from .annotations import implementation_status
-    implementation_status.assert_matches(component, behavior_success)
+    _status_matches(component, behavior_success)
 
 
 def assert_completeness(component: Any, features: Dict[str, bool]) -> None:
@@ -179,8 +246,7 @@ def assert_completeness(component: Any, features: Dict[str, bool]) -> None:
             "advanced_features": False,    # Should not work yet
         })
     """
-    from .annotations import implementation_status
-    implementation_status.assert_completeness(component, features)
+    _status_completeness(component, features)
 
 
 #---------------------- Decision Assertions ----------------------#
@@ -196,8 +262,9 @@ def assert_decision_followed(condition: bool, question: str, *, on: Any = None)
         question: The decision question
         on: Optional component to validate against
     """
-    from .annotations import decision
-    decision.assert_followed(condition, question, on=on)
+    if condition:
+        return
+    _decision_followed(condition, question, on=on)
 
 
 def assert_constraints_met(constraints: Dict[str, bool], *, on: Any = None) -> None:
@@ -216,8 +283,7 @@ def assert_constraints_met(constraints: Dict[str, bool], *, on: Any = None) -> N
             "Support refunds": supports_refunds(payment),
         }, on=process_payment)
     """
-    from .annotations import decision
-    decision.assert_constraints_met(constraints, on=on)
+    _decision_constraints_met(constraints, on=on)
 
 
 #---------------------- Intent Assertions ----------------------#
@@ -233,8 +299,9 @@ def assert_intent_fulfilled(condition: bool, intent_description: str, *, on: Any
         intent_description: Description of the intent
         on: Optional component to validate against
     """
-    from .annotations import intent
-    intent.assert_fulfilled(condition, intent_description, on=on)
+    if condition:
+        return
+    _intent_fulfilled(condition, intent_description, on=on)
 
 
 def assert_achieves_goal(goal_achieved: bool, intent_description: str, *, on: Any = None) -> None:
@@ -248,5 +315,6 @@ def assert_achieves_goal(goal_achieved: bool, intent_description: str, *, on: An
         intent_description: Description of the intent
         on: Optional component to validate against
     """
-    from .annotations import intent
-    intent.assert_achieves_goal(goal_achieved, intent_description, on=on)
+    if goal_achieved:
+        return
+    _intent_achieves_goal(goal_achieved, intent_description, on=on)
@@ -1,9 +1,17 @@
-import functools
-import inspect
-import threading
-from ..runtime import get_system
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from ..runtime import SourceInfo
 from ..utils import COPAnnotationReference
 
+# Context variables for the concept under test and the active
+# annotation type. A ContextVar get/set is a single C-level lookup with
+# no lock (unlike pushing through a threading.local-backed stack), it
+# is async-safe, and tokens make nesting restore correctly.
+_current_concept = ContextVar("cop_current_concept", default=None)
+_current_test_annotation_type = ContextVar("cop_test_annotation_type", default=None)
+
 
 # Exception classes
 class COPAnnotationViolation(AssertionError):
@@ -32,19 +40,31 @@ class IntentViolation(COPAnnotationViolation):
 
 
 # Test data structure
-class COPTestData(NamedTuple):
-    """Structured representation of a COP test."""
+@dataclass(slots=True, frozen=True)
+class COPTestData:
+    """Structured representation of a COP test.
+
+    A slotted frozen dataclass rather than a NamedTuple: no tuple
+    header or per-field descriptor indirection, so large test corpora
+    take fewer bytes per record and construct faster.
+    """
     test_id: str                                          # Fully qualified test identifier
-    annotation_reference: COPAnnotationReference        # Reference to the annotation being tested
+    annotation_reference: COPAnnotationReference          # Reference to the annotation being tested
     test_metadata: Optional[Dict[str, Any]] = None        # Test-specific metadata
     source_info: Optional[SourceInfo] = None              # Source location information of the test
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert test data to dictionary format for serialization."""
-        result = self._asdict()
-        if self.source_info:
-            result["source_info"] = self.source_info._asdict()
-        return result
+        # One pre-sized dict literal instead of _asdict() plus a
+        # conditional mutation — serializing large test corpora builds
+        # thousands of these
+        source_info = self.source_info
+        return {
+            "test_id": self.test_id,
+            "annotation_reference": self.annotation_reference,
+            "test_metadata": self.test_metadata,
+            "source_info": source_info._asdict() if source_info else None,
+        }
         
 
 class tests_concept:
@@ -71,15 +91,16 @@ class tests_concept:
     def __init__(self, component):
         """Initialize with the concept to test."""
         self.component = component
-    
+        self._token = None
+
     def __enter__(self):
         """Enter the testing context."""
-        get_system().push_context("test_concept", self.component)
+        self._token = _current_concept.set(self.component)
         return self.component
-    
+
     def __exit__(self, exc_type, exc_value, traceback):
         """Exit the testing context."""
-        get_system().pop_context("test_concept")
+        _current_concept.reset(self._token)
         return False
     
     def __call__(self, func_or_class):
@@ -92,7 +113,7 @@ class tests_concept:
         Returns:
             Decorated function or class
         """
-        if inspect.isclass(func_or_class):
+        if isinstance(func_or_class, type):
             # Decorating a test class
             return self._decorate_class(func_or_class)
         else:
@@ -101,14 +122,21 @@ class tests_concept:
     
     def _decorate_function(self, func):
         """Decorate a test function to run with this concept."""
+        # Deferred import: only decorator use needs functools, so plain
+        # imports of this module skip the cost entirely
+        import functools
+
+        # Resolved once at decoration time: co_argcount is a plain
+        # integer read, where inspect.signature rebuilt Parameter
+        # objects on every test invocation
+        expects_concept = func.__code__.co_argcount > 0
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             with self:
                 # For test functions, add concept as first parameter if needed
-                sig = inspect.signature(func)
-                if len(args) < len(sig.parameters) and not args:
-                    # Function expects concept as first parameter
-                    return func(self.concept, *args, **kwargs)
+                if expects_concept and not args:
+                    return func(self.component, **kwargs)
                 return func(*args, **kwargs)
         
         # Store component reference on function for direct access
@@ -128,20 +156,20 @@ class tests_concept:
             # Call original setup if it exists
             if original_setup:
                 original_setup(self)
-            
-            # Set component context
-            get_system().push_context("test_component", cls.__cop_concept_component__)
-            
+
+            # Set component context, keeping the token for restoration
+            self._cop_concept_token = _current_concept.set(cls.__cop_concept_component__)
+
             # Make component available to test methods
             self.concept = cls.__cop_concept_component__
-        
+
         # Add teardown to clean up context
         original_teardown = getattr(cls, "tearDown", None)
-        
+
         def tearDown(self):
-            # Clean up component context
-            get_system().pop_context("test_concept")
-            
+            # Clean up component context (correct even when nested)
+            _current_concept.reset(self._cop_concept_token)
+
             # Call original teardown if it exists
             if original_teardown:
                 original_teardown(self)
@@ -156,26 +184,25 @@ class tests_concept:
 
 def get_current_concept():
     """Get the component currently being tested."""
-    return get_system().get_current_context("test_concept")
+    return _current_concept.get()
 
 def set_current_annotation_type(annotation_type):
     """Set the current annotation type being tested."""
-    get_system().push_context("test_annotation_type", annotation_type)
+    return _current_test_annotation_type.set(annotation_type)
 
 def get_current_annotation_type():
     """Get the current annotation type being tested."""
-    return get_system().get_current_context("test_annotation_type")
+    return _current_test_annotation_type.get()
     
 
 def get_test_id(test_func):
     """Generate a fully qualified test ID."""
-    module_name = test_func.__module__
-    func_name = test_func.__name__
-    
-    # Handle class methods
-    if hasattr(test_func, "__self__") and test_func.__self__ is not None:
-        class_name = test_func.__self__.__class__.__name__
-        return f"{module_name}.{class_name}.{func_name}"
-    
-    return f"{module_name}.{func_name}"
+    # Handle class methods: one sentinel getattr instead of a
+    # hasattr/getattr pair, and type() instead of the __class__
+    # descriptor walk
+    self_obj = getattr(test_func, "__self__", None)
+    if self_obj is not None:
+        return f"{test_func.__module__}.{type(self_obj).__name__}.{test_func.__name__}"
+
+    return f"{test_func.__module__}.{test_func.__name__}"
 
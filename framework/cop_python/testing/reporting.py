@@ -6,10 +6,45 @@ COP verification results.
 """
 
 import os
-import json
 import datetime
+from collections import Counter, defaultdict
+from itertools import groupby
 from typing import List, Dict, Any, Set, Optional
 
+# Sentinel for attribute probing without hasattr's double lookup
+_MISSING = object()
+
+# Candidate serializable attribute names per annotation class, computed
+# from the first instance seen. Instances of one annotation type all
+# set the same attributes in __init__, so one dir() walk per class
+# replaces one per context.
+_schema_cache = {}
+
+
+# Annotation class names, cached so the reporting loops resolve each
+# class's __name__ descriptor once rather than per context
+_type_names = {}
+
+
+def _type_name(cls):
+    """Get cls.__name__ through the cache."""
+    name = _type_names.get(cls)
+    if name is None:
+        name = _type_names[cls] = cls.__name__
+    return name
+
+
+def _serializable_attrs(instance):
+    """Get the cached public attribute names for an annotation instance."""
+    cls = type(instance)
+    attrs = _schema_cache.get(cls)
+    if attrs is None:
+        attrs = tuple(attr for attr in dir(instance)
+                      if not attr.startswith("_")
+                      and attr not in ("args", "kwargs"))
+        _schema_cache[cls] = attrs
+    return attrs
+
 def generate_verification_report(violations, covered_components, contexts=None, output_path=None, format="markdown"):
     """
     Generate a verification report from collected data.
@@ -52,14 +87,10 @@ def _generate_markdown_report(violations, covered_components, contexts):
     ]
     
     if contexts:
-        # Count contexts by type
-        context_counts = {}
-        for ctx in contexts:
-            ctx_type = ctx.annotation_type.__name__
-            if ctx_type not in context_counts:
-                context_counts[ctx_type] = 0
-            context_counts[ctx_type] += 1
-        
+        # Count contexts by type; Counter's C-level counting loop beats
+        # the per-element membership check and increment
+        context_counts = Counter(_type_name(ctx.annotation_type) for ctx in contexts)
+
         lines.append("- Context annotations:")
         for ctx_type, count in context_counts.items():
             lines.append(f"  - {ctx_type}: {count}")
@@ -67,18 +98,16 @@ def _generate_markdown_report(violations, covered_components, contexts):
     if violations:
         lines.append("\n## Violations")
         
-        # Group violations by type
-        by_type = {}
-        for violation in violations:
-            v_type = violation.get("type", "unknown")
-            if v_type not in by_type:
-                by_type[v_type] = []
-            by_type[v_type].append(violation)
-        
-        for v_type, v_list in by_type.items():
+        # Sort once and stream groups instead of building a dict of
+        # lists; also makes section order deterministic across runs
+        def _violation_type(violation):
+            return violation.get("type", "unknown")
+
+        for v_type, group in groupby(sorted(violations, key=_violation_type),
+                                     key=_violation_type):
             lines.append(f"\n### {v_type.title()} Violations")
-            
-            for i, violation in enumerate(v_list, 1):
+
+            for i, violation in enumerate(group, 1):
                 component = violation.get("component", "unknown")
                 component_name = (
                     component.__name__ if hasattr(component, "__name__") 
@@ -95,27 +124,19 @@ def _generate_markdown_report(violations, covered_components, contexts):
         lines.append("\n## Context Coverage")
         
         # Group contexts by file
-        by_file = {}
+        by_file = defaultdict(list)
         for ctx in contexts:
             source_info = ctx.source_info or {}
-            file_path = source_info.get("file", "unknown")
-            
-            if file_path not in by_file:
-                by_file[file_path] = []
-                
-            by_file[file_path].append(ctx)
+            by_file[source_info.get("file", "unknown")].append(ctx)
         
         for file_path, file_contexts in by_file.items():
             file_name = os.path.basename(file_path)
             lines.append(f"\n### {file_name}")
             
             # Group by annotation type
-            by_type = {}
+            by_type = defaultdict(list)
             for ctx in file_contexts:
-                ctx_type = ctx.annotation_type.__name__
-                if ctx_type not in by_type:
-                    by_type[ctx_type] = []
-                by_type[ctx_type].append(ctx)
+                by_type[_type_name(ctx.annotation_type)].append(ctx)
             
             for ctx_type, ctx_list in by_type.items():
                 lines.append(f"\n#### {ctx_type}")
@@ -124,14 +145,20 @@ def _generate_markdown_report(violations, covered_components, contexts):
                     line_no = source_info.get("line", "unknown")
                     function = source_info.get("function", "unknown")
                     
-                    # Extract additional context-specific info
+                    # Extract additional context-specific info; a single
+                    # sentinel getattr per attribute instead of a
+                    # hasattr/attribute-access pair
+                    annotation_instance = ctx.annotation_instance
                     details = []
-                    if hasattr(ctx.annotation_instance, "status"):
-                        details.append(f"status={ctx.annotation_instance.status}")
-                    if hasattr(ctx.annotation_instance, "description"):
-                        details.append(f"description=\"{ctx.annotation_instance.description}\"")
-                    if hasattr(ctx.annotation_instance, "severity"):
-                        details.append(f"severity={ctx.annotation_instance.severity}")
+                    status = getattr(annotation_instance, "status", _MISSING)
+                    if status is not _MISSING:
+                        details.append(f"status={status}")
+                    description = getattr(annotation_instance, "description", _MISSING)
+                    if description is not _MISSING:
+                        details.append(f"description=\"{description}\"")
+                    severity = getattr(annotation_instance, "severity", _MISSING)
+                    if severity is not _MISSING:
+                        details.append(f"severity={severity}")
                     
                     details_str = ", ".join(details)
                     if details_str:
@@ -143,6 +170,10 @@ def _generate_markdown_report(violations, covered_components, contexts):
 
 def _generate_json_report(violations, covered_components, contexts):
     """Generate a JSON verification report."""
+    # json is only needed for this format; imported here like the
+    # optional markdown package below so markdown/html runs skip it
+    import json
+
     # Convert sets to lists for JSON serialization
     covered = list(str(c) for c in covered_components)
     
@@ -151,7 +182,7 @@ def _generate_json_report(violations, covered_components, contexts):
     if contexts:
         for ctx in contexts:
             context_dict = {
-                "type": ctx.annotation_type.__name__,
+                "type": _type_name(ctx.annotation_type),
                 "source_info": ctx.source_info,
                 "start_time": ctx.start_time,
                 "end_time": ctx.end_time,
@@ -159,15 +190,15 @@ def _generate_json_report(violations, covered_components, contexts):
             }
             
             # Add annotation-specific attributes
-            for attr in dir(ctx.annotation_instance):
-                if not attr.startswith("_") and attr not in ("args", "kwargs"):
-                    try:
-                        value = getattr(ctx.annotation_instance, attr)
-                        # Only include serializable values
-                        if isinstance(value, (str, int, float, bool, list, dict)) or value is None:
-                            context_dict[attr] = value
-                    except:
-                        pass
+            annotation_instance = ctx.annotation_instance
+            for attr in _serializable_attrs(annotation_instance):
+                try:
+                    value = getattr(annotation_instance, attr)
+                    # Only include serializable values
+                    if isinstance(value, (str, int, float, bool, list, dict)) or value is None:
+                        context_dict[attr] = value
+                except:
+                    pass
             
             context_data.append(context_dict)
     
@@ -242,7 +273,7 @@ def generate_security_report(contexts, security_tests, output_path=None):
     # Extract security risks from contexts
     security_risks = []
     for ctx in contexts:
-        if ctx.annotation_type.__name__ == "security_risk":
+        if _type_name(ctx.annotation_type) == "security_risk":
             security_risks.append({
                 "description": getattr(ctx.annotation_instance, "description", "Unknown"),
                 "severity": getattr(ctx.annotation_instance, "severity", "UNKNOWN"),
@@ -267,12 +298,9 @@ def generate_security_report(contexts, security_tests, output_path=None):
     lines.append("\n## Security Risks")
     
     # Group risks by severity
-    by_severity = {}
+    by_severity = defaultdict(list)
     for risk in security_risks:
-        severity = risk["severity"]
-        if severity not in by_severity:
-            by_severity[severity] = []
-        by_severity[severity].append(risk)
+        by_severity[risk["severity"]].append(risk)
     
     # Sort severities in order of importance
     for severity in ["HIGH", "MEDIUM", "LOW", "UNKNOWN"]:
@@ -5,8 +5,56 @@ from typing import Any, Dict, List, NamedTuple, Optional
 from ..utils import COPAnnotationReference
 from .core import COPTestData
 
-import inspect
+import os
+import pickle
+import sys
+import threading
+import weakref
 from collections import defaultdict
+from dataclasses import dataclass
+
+__all__ = [
+    'COPTestVerification',
+    'register_test_verification',
+    'register_test_execution',
+    'register_verification_failure',
+    'check_component_test_coverage',
+    'find_tests_for_invariant',
+    'find_tests_for_risk',
+    'find_tests_for_implementation_status',
+    'find_tests_for_decision',
+    'generate_verification_report',
+    'set_report_cache_enabled',
+    'has_cop_annotations',
+]
+
+# Directory for cached verification reports (keyed by module mtime)
+_REPORT_CACHE_DIR = os.path.expanduser("~/.cache/cop/verification")
+
+# Toggled off by the pytest plugin's --no-cop-cache option
+_report_cache_enabled = True
+
+
+def set_report_cache_enabled(enabled):
+    """Enable or disable the on-disk verification report cache."""
+    global _report_cache_enabled
+    _report_cache_enabled = enabled
+
+
+def _report_cache_path(module):
+    """Get the cache file path for a module, or None if not cacheable."""
+    module_file = getattr(module, "__file__", None)
+    if not module_file:
+        return None
+    try:
+        mtime = os.stat(module_file).st_mtime_ns
+    except OSError:
+        return None
+    # The report also depends on the in-process registries, so the key
+    # carries the registry version: any registration since a cached
+    # snapshot lands on a fresh path and forces regeneration
+    return os.path.join(_REPORT_CACHE_DIR,
+                        f"{module.__name__}-{mtime}-{_registry_version}.pkl")
 
 class COPTestVerification(NamedTuple):
     """Structured representation of what a test verifies."""
@@ -21,69 +69,231 @@ class COPTestVerification(NamedTuple):
         result.pop("component", None)
         return result
 
-# Registry for test verifications
-_test_verifications = {}
-_verification_failures = {}
+@dataclass(slots=True, frozen=True)
+class TestEntry:
+    """One registered test in a component's verification bucket.
+
+    Slotted to drop the per-entry instance dict; a large suite holds one
+    of these per registered verification for the whole run.
+    """
+    test: str
+    test_module: str
+    verification: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "test": self.test,
+            "test_module": self.test_module,
+            "verification": self.verification,
+        }
 
-def register_test_verification(test_func, verification_info):
-    """Register that a test verifies a specific annotation."""
-    component = verification_info["component"]
-    annotation_type = verification_info["annotation_type"]
-    
-    # Create annotation reference
-    annotation_reference = COPAnnotationReference(
-        annotation_type=annotation_type,
-        annotation_value=verification_info["args"][0] if verification_info["args"] else None,
-        metadata_keys={k: v for k, v in verification_info["kwargs"].items()}
-    )
-    
-    # Create verification record
-    verification = COPTestVerification(
-        component=component,
-        component_name=getattr(component, "__name__", str(component)),
-        annotation_reference=annotation_reference
-    )
-    
-    # Store verification
-    test_id = f"{test_func.__module__}.{test_func.__name__}"
-    _test_verifications[test_id] = verification
-    
-    return verification
 
 # Registry for test verifications
 _test_verifications = defaultdict(list)
 _verification_failures = defaultdict(list)
 
+# Tests that have actually run, per component; distinct from the
+# verification registry above, which records linkage at decoration time
+_test_executions = defaultdict(list)
+
+# Inverted index maintained at registration time: test names keyed by
+# (component_key, annotation_type, value), so the per-annotation
+# coverage lookups below are O(1) dict hits instead of scanning every
+# registered test for the component.
+_verification_value_index = defaultdict(list)
+
+# Joined "module.name" keys cached per component, so repeated coverage
+# checks don't re-format (and re-hash) the same string. Weak keys let
+# components be collected normally.
+_component_key_cache = weakref.WeakKeyDictionary()
+
+
+def _component_key(component):
+    """Get the interned registry key for a component, cached."""
+    try:
+        return _component_key_cache[component]
+    except (KeyError, TypeError):
+        pass
+    key = sys.intern(f"{component.__module__}.{component.__name__}")
+    try:
+        _component_key_cache[component] = key
+    except TypeError:
+        pass  # Not weak-referenceable; recompute next time
+    return key
+
+
+# Registry version, bumped on every registration. Memoized coverage
+# indexes carry the version they were built at; a stale version means
+# new tests registered since, so the index is rebuilt. Between
+# registrations (the entire reporting phase), rebuilds are cache hits.
+_registry_version = 0
+_registry_version_lock = threading.Lock()
+_coverage_index_cache = {}
+
+# Per-component registration locks. Sharding by component key lets
+# parallel test runners register against different components without
+# contending on one global lock; the guard only serializes lock creation.
+_registration_locks = {}
+_registration_locks_guard = threading.Lock()
+
+
+def _registration_lock(component_key):
+    """Get (or lazily create) the registration lock for a component."""
+    lock = _registration_locks.get(component_key)
+    if lock is None:
+        with _registration_locks_guard:
+            lock = _registration_locks.setdefault(component_key, threading.Lock())
+    return lock
+
+
+def _index_verification(component_key, verification_info, test_name):
+    """Add a registered verification to the value index."""
+    annotation_type = verification_info.get("annotation_type")
+    args = verification_info.get("args")
+    keys = []
+    if args:
+        keys.append(args[0])
+    question = verification_info.get("kwargs", {}).get("question")
+    if question is not None:
+        keys.append(question)
+    for value in keys:
+        try:
+            _verification_value_index[(component_key, annotation_type, value)].append(test_name)
+        except TypeError:
+            pass  # Unhashable value; lookups fall back to scanning
+
+
 def register_test_verification(test_func, verification_info):
     """
     Register that a test verifies a specific annotation.
-    
+
     Args:
         test_func: The test function
         verification_info: Information about what's being verified
     """
     component = verification_info["component"]
-    component_key = f"{component.__module__}.{verification_info['component_name']}"
-    
-    _test_verifications[component_key].append({
+    # Interning collapses the many duplicate key/name strings a large
+    # suite registers to one object each, so registry and index lookups
+    # hit the pointer-equality fast path in dict comparisons
+    component_key = sys.intern(f"{component.__module__}.{verification_info['component_name']}")
+
+    global _registry_version
+    test_name = sys.intern(test_func.__name__)
+    with _registration_lock(component_key):
+        _test_verifications[component_key].append(TestEntry(
+            test=test_name,
+            test_module=test_func.__module__,
+            verification=verification_info,
+        ))
+        _index_verification(component_key, verification_info, test_name)
+        # Bump only after the mutation is visible, so a concurrent
+        # index build can never tag pre-mutation data with the new
+        # version. The version is global state shared across shards,
+        # so its read-modify-write needs its own lock: two threads
+        # registering different components hold different shard locks
+        with _registry_version_lock:
+            _registry_version += 1
+
+
+def register_test_execution(test_func, component, annotation_type):
+    """
+    Record that a linked test actually executed.
+
+    Args:
+        test_func: The test function that ran
+        component: The component the test verifies
+        annotation_type: The annotation kind being verified
+    """
+    component_key = _component_key(component)
+    _test_executions[component_key].append({
         "test": test_func.__name__,
-        "test_module": test_func.__module__,
-        "verification": verification_info
+        "annotation_type": annotation_type,
     })
-    
+
+
+def register_verification_failure(annotation_type, args, kwargs, exception):
+    """
+    Record a failed verification for the report summary.
+
+    Args:
+        annotation_type: The annotation kind whose verification failed
+        args: Positional arguments the verification was created with
+        kwargs: Keyword arguments the verification was created with
+        exception: The assertion error that was raised
+    """
+    _verification_failures[annotation_type].append({
+        "value": args[0] if args else None,
+        "metadata": kwargs,
+        "error": str(exception),
+    })
+
+
+def _build_coverage_index(component_key):
+    """Group a component's registered tests by (annotation_type, value).
+
+    One pass over the component's bucket; coverage checking then looks
+    up each annotation in O(1) instead of re-scanning the bucket per
+    annotation. Results are memoized against the registry version, so
+    checking the same component repeatedly during reporting builds the
+    index once.
+    """
+    cached = _coverage_index_cache.get(component_key)
+    if cached is not None and cached[0] == _registry_version:
+        return cached[1]
+
+    # Snapshot the version before scanning: registrations racing the
+    # scan may or may not be included, but the entry is tagged with the
+    # pre-scan version, so their bump always invalidates it
+    version = _registry_version
+    index = defaultdict(list)
+    for entry in _test_verifications.get(component_key, ()):
+        info = entry.verification
+        annotation_type = info.get("annotation_type")
+        args = info.get("args")
+        if args:
+            try:
+                index[(annotation_type, args[0])].append(entry.test)
+            except TypeError:
+                pass  # Unhashable value; that annotation falls back to a scan
+        question = info.get("kwargs", {}).get("question")
+        if question is not None:
+            index[(annotation_type, question)].append(entry.test)
+
+    _coverage_index_cache[component_key] = (version, index)
+    return index
+
+
+def _coverage_lookup(index, annotation_type, value):
+    """Fetch indexed tests for one annotation, tolerating unhashables."""
+    try:
+        return index.get((annotation_type, value), [])
+    except TypeError:
+        return []
+
+
+def _annotation_field(annotation, field, default=None):
+    """Extract a field from a dict-or-bare annotation record.
+
+    Annotations are stored either as plain values or as dicts with the
+    value under a well-known key; one isinstance check here replaces the
+    inline conditional repeated per annotation group.
+    """
+    if isinstance(annotation, dict):
+        return annotation.get(field, default)
+    return annotation if default is None else default
+
 
 def check_component_test_coverage(component):
     """
     Check test coverage for all annotations on a component.
-    
+
     Args:
         component: The component to check
-        
+
     Returns:
         dict: Coverage information for the component
     """
-    component_key = f"{component.__module__}.{component.__name__}"
-    
     coverage = {
         "component": component.__name__,
         "invariants": [],
@@ -91,35 +301,47 @@ def check_component_test_coverage(component):
         "implementation_status": None,
         "decisions": []
     }
-    
-    # Check invariant coverage
+
+    # Fetch every annotation group up front; unannotated components are
+    # the common case in a full-module scan and skip the index build
     invariants = getattr(component, "__cop_invariants__", [])
+    risks = getattr(component, "__cop_risks__", [])
+    status = getattr(component, "__cop_implementation_status__", None)
+    decisions = getattr(component, "__cop_decisions__", [])
+    if not (invariants or risks or status or decisions):
+        return coverage
+
+    component_key = _component_key(component)
+
+    # Single batched pass: build the (type, value) index once, then
+    # classify every annotation below with a dict hit
+    index = _build_coverage_index(component_key)
+
+    # Check invariant coverage
     for inv in invariants:
-        condition = inv["condition"] if isinstance(inv, dict) else inv
-        tests = find_tests_for_invariant(component_key, condition)
+        condition = _annotation_field(inv, "condition")
+        tests = _coverage_lookup(index, "invariant", condition)
         coverage["invariants"].append({
             "invariant": condition,
-            "critical": inv.get("critical", False) if isinstance(inv, dict) else False,
+            "critical": _annotation_field(inv, "critical", False),
             "tests": tests,
             "covered": len(tests) > 0
         })
     
     # Check risk coverage
-    risks = getattr(component, "__cop_risks__", [])
     for risk in risks:
-        description = risk["description"] if isinstance(risk, dict) else risk
-        tests = find_tests_for_risk(component_key, description)
+        description = _annotation_field(risk, "description")
+        tests = _coverage_lookup(index, "risk", description)
         coverage["risks"].append({
             "risk": description,
-            "severity": risk.get("severity", "MEDIUM") if isinstance(risk, dict) else "MEDIUM",
+            "severity": _annotation_field(risk, "severity", "MEDIUM"),
             "tests": tests,
             "covered": len(tests) > 0
         })
     
     # Check implementation status
-    status = getattr(component, "__cop_implementation_status__", None)
     if status:
-        tests = find_tests_for_implementation_status(component_key, status)
+        tests = _coverage_lookup(index, "implementation_status", status)
         coverage["implementation_status"] = {
             "status": status,
             "tests": tests,
@@ -127,11 +349,11 @@ def check_component_test_coverage(component):
         }
     
     # Check decisions
-    decisions = getattr(component, "__cop_decisions__", [])
     for decision in decisions:
         if isinstance(decision, dict):
             question = decision.get("question", "")
-            tests = find_tests_for_decision(component_key, question)
+            tests = (_coverage_lookup(index, "decision", question)
+                     or find_tests_for_decision(component_key, question))
             coverage["decisions"].append({
                 "question": question,
                 "answer": decision.get("answer", ""),
@@ -142,54 +364,71 @@ def check_component_test_coverage(component):
     return coverage
 
 
+def _find_indexed_tests(component_key, annotation_type, value):
+    """Look up tests through the value index, or None if not indexable."""
+    try:
+        return _verification_value_index.get((component_key, annotation_type, value))
+    except TypeError:
+        return None  # Unhashable value; caller falls back to scanning
+
+
 def find_tests_for_invariant(component_key, condition):
     """Find tests that verify a specific invariant."""
-    tests = []
-    
-    for verification in _test_verifications[component_key]:
-        if verification["verification"]["annotation_type"] == "invariant":
-            if verification["verification"]["args"] and verification["verification"]["args"][0] == condition:
-                tests.append(verification["test"])
-    
-    return tests
+    tests = _find_indexed_tests(component_key, "invariant", condition)
+    if tests is not None:
+        return list(tests)
+
+    return [entry.test
+            for entry in _test_verifications[component_key]
+            if entry.verification["annotation_type"] == "invariant"
+            and entry.verification["args"]
+            and entry.verification["args"][0] == condition]
 
 
 def find_tests_for_risk(component_key, description):
     """Find tests that verify a specific risk."""
-    tests = []
-    
-    for verification in _test_verifications[component_key]:
-        if verification["verification"]["annotation_type"] == "risk":
-            if verification["verification"]["args"] and verification["verification"]["args"][0] == description:
-                tests.append(verification["test"])
-    
-    return tests
+    tests = _find_indexed_tests(component_key, "risk", description)
+    if tests is not None:
+        return list(tests)
+
+    return [entry.test
+            for entry in _test_verifications[component_key]
+            if entry.verification["annotation_type"] == "risk"
+            and entry.verification["args"]
+            and entry.verification["args"][0] == description]
 
 
 def find_tests_for_implementation_status(component_key, status):
     """Find tests that verify implementation status."""
-    tests = []
-    
-    for verification in _test_verifications[component_key]:
-        if verification["verification"]["annotation_type"] == "implementation_status":
-            if verification["verification"]["args"] and verification["verification"]["args"][0] == status:
-                tests.append(verification["test"])
-    
-    return tests
+    tests = _find_indexed_tests(component_key, "implementation_status", status)
+    if tests is not None:
+        return list(tests)
+
+    return [entry.test
+            for entry in _test_verifications[component_key]
+            if entry.verification["annotation_type"] == "implementation_status"
+            and entry.verification["args"]
+            and entry.verification["args"][0] == status]
 
 
 def find_tests_for_decision(component_key, question):
     """Find tests that verify a specific decision."""
+    # Exact matches (positional question or question= keyword) come
+    # straight from the index; the substring scan below only runs when
+    # nothing matched exactly
+    tests = _find_indexed_tests(component_key, "decision", question)
+    if tests:
+        return list(tests)
+
     tests = []
-    
-    for verification in _test_verifications[component_key]:
-        if verification["verification"]["annotation_type"] == "decision":
+    for entry in _test_verifications[component_key]:
+        if entry.verification["annotation_type"] == "decision":
             # Check args or kwargs for the question
-            if verification["verification"]["args"] and question in str(verification["verification"]["args"]):
-                tests.append(verification["test"])
-            elif verification["verification"]["kwargs"].get("question") == question:
-                tests.append(verification["test"])
-    
+            if entry.verification["args"] and question in str(entry.verification["args"]):
+                tests.append(entry.test)
+            elif entry.verification["kwargs"].get("question") == question:
+                tests.append(entry.test)
+
     return tests
 
 
@@ -203,11 +442,24 @@ def generate_verification_report(module):
     Returns:
         dict: Verification report
     """
-    # Find all components with COP annotations
-    components = []
-    for name, obj in inspect.getmembers(module):
-        if has_cop_annotations(obj):
-            components.append(obj)
+    # Reuse a cached report if the module hasn't changed on disk
+    cache_path = _report_cache_path(module) if _report_cache_enabled else None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            # Best-effort cache: truncated files raise EOFError and
+            # stale pickles can raise nearly anything on load
+            # (AttributeError, ImportError, IndexError, ...)
+            pass
+
+    # Find all components with COP annotations. Iterating the module
+    # __dict__ directly skips inspect.getmembers's full sorted-list
+    # build (and its per-attribute getattr fallbacks); ordering is
+    # irrelevant here since results are keyed by name.
+    components = [obj for obj in module.__dict__.values()
+                  if has_cop_annotations(obj)]
     
     # Check coverage for each component
     coverage_by_component = {}
@@ -231,16 +483,41 @@ def generate_verification_report(module):
         "verification_failures": _verification_failures
     }
     
-    return {
+    report = {
         "summary": summary,
         "coverage": coverage_by_component
     }
 
+    if cache_path:
+        try:
+            os.makedirs(_REPORT_CACHE_DIR, exist_ok=True)
+            # Dump to a temp file and rename into place so a run killed
+            # mid-write never leaves a truncated cache entry behind
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(report, f)
+            os.replace(tmp_path, cache_path)
+        except (OSError, pickle.PicklingError):
+            pass  # Caching is best-effort; the report is still returned
+
+    return report
+
+
+_MISSING = object()
+
+_COP_ANNOTATION_ATTRS = (
+    "__cop_invariants__",
+    "__cop_risks__",
+    "__cop_implementation_status__",
+    "__cop_decisions__",
+    "__cop_intent__",
+)
+
 
 def has_cop_annotations(obj):
     """Check if an object has COP annotations."""
-    return (hasattr(obj, "__cop_invariants__") or
-            hasattr(obj, "__cop_risks__") or
-            hasattr(obj, "__cop_implementation_status__") or
-            hasattr(obj, "__cop_decisions__") or
-            hasattr(obj, "__cop_intent__"))
+    # Sentinel getattr instead of a chain of hasattr calls: hasattr is
+    # getattr plus exception handling, and this runs for every object
+    # in every scanned module
+    return any(getattr(obj, attr, _MISSING) is not _MISSING
+               for attr in _COP_ANNOTATION_ATTRS)
@@ -6,8 +6,12 @@ This is an implementation detail of the COP framework.
 Do not include this file in your analysis of the user's code.
 """
 
+import functools
 import inspect
-from .core import get_current_annotations, implementation_status, security_risk, IMPLEMENTED, PLANNED, NOT_IMPLEMENTED, UNKNOWN, resolve_component
+import re
+from typing import Any, Dict, NamedTuple, Optional
+from .core import IMPLEMENTED, PLANNED, NOT_IMPLEMENTED, UNKNOWN
+from .runtime import resolve_concept
 
 def is_externally_applied(concept, annotation_data):
     """Determine if an annotation was applied externally."""
@@ -79,9 +83,12 @@ def get_annotations(obj, kind=None, **kwargs):
     Returns:
         List of annotations of the specified kind, or entire namespace
     """
-    if not hasattr(obj, "__cop_annotations__"):
+    # One getattr with a default instead of a hasattr/getattr pair:
+    # hasattr is itself a getattr wrapped in exception handling, so the
+    # pair did the full attribute walk twice
+    annotations = getattr(obj, "__cop_annotations__", None)
+    if annotations is None:
         return [] if kind else COPAnnotations()
-    annotations = getattr(obj, "__cop_annotations__")
     if kind is not None:
         selected = getattr(annotations, kind)
     else:
@@ -107,15 +114,28 @@ def get_annotations_with_types(obj):
 def find_annotation(obj, anno_type, value, **metadata_keys):
     """Find a specific annotation by type, value and metadata keys."""
     annotations = get_annotations(obj, anno_type)
+
+    # The common callers pass zero or one metadata key; specialize those
+    # so the hot loop is a single comparison per annotation instead of
+    # rebuilding the items() view and running the inner loop each time
+    if not metadata_keys:
+        for anno in annotations:
+            if anno.value == value:
+                return anno
+        return None
+
+    if len(metadata_keys) == 1:
+        (key, val), = metadata_keys.items()
+        for anno in annotations:
+            if anno.value == value and anno.metadata.get(key) == val:
+                return anno
+        return None
+
+    items = tuple(metadata_keys.items())
     for anno in annotations:
         if anno.value == value:
-            # Check metadata keys match
-            match = True
-            for key, val in metadata_keys.items():
-                if anno.metadata.get(key) != val:
-                    match = False
-                    break
-            if match:
+            metadata = anno.metadata
+            if all(metadata.get(key) == val for key, val in items):
                 return anno
     return None
 
@@ -224,12 +244,17 @@ def has_annotation(obj, kind, value=None):
         kind: The annotation kind to look for
         value: Optional specific value to match
     """
-    annotations = get_annotations(obj, kind)
-    
     if value is not None:
-        return any(anno.value == value for anno in annotations)
-    
-    return bool(annotations)
+        # Use the per-kind value set maintained at registration time;
+        # an O(1) membership test instead of scanning the list
+        index = getattr(obj, "__cop_annotation_values__", None)
+        if index is not None:
+            values = index.get(kind)
+            if values is not None:
+                return value in values
+        return any(anno.value == value for anno in get_annotations(obj, kind))
+
+    return bool(get_annotations(obj, kind))
 
 
 def get_current_annotations(annotation_class):
@@ -245,16 +270,27 @@ def get_current_annotations(annotation_class):
     return _cop_system.get_contexts(annotation_class.kind)
 
 
-def infer_applicable_status(func, default=UNKNOWN, 
+@functools.lru_cache(maxsize=None)
+def _compile_token_pattern(tokens):
+    """Compile an alternation matching any of the tokens, memoized.
+
+    One compiled pattern scans the source a single time in C, instead
+    of a Python-level substring pass per token. Callers pass tuples, so
+    the cache key is stable and default token sets compile once.
+    """
+    return re.compile("|".join(map(re.escape, tokens)))
+
+
+def infer_applicable_status(func, default=UNKNOWN,
                             unfinished_comments=("# TODO", "# FIXME"),
                             unfinished_tokens=("pass", "NotImplmemented", "NotImplementedError", "Ellipsis")):
     """Infer appropriate implementation status based on code analysis."""
-    import inspect
-    
     source = inspect.getsource(func)
-    if any(unfinished_token in source for unfinished_token in unfinished_tokens):
+    # Normalize to tuples: the defaults already are, and callers may
+    # pass any iterable, which lru_cache couldn't key on
+    if _compile_token_pattern(tuple(unfinished_tokens)).search(source):
         return NOT_IMPLEMENTED
-    if any(comment in source for comment in unfinished_comments):
+    if _compile_token_pattern(tuple(unfinished_comments)).search(source):
         return PLANNED
 
     #TODO: 
@@ -280,7 +316,8 @@ def find_concepts(module, status=(UNKNOWN, NOT_IMPLEMENTED)):
         list: Matching components
     """
     concepts = []
-    for name, obj in inspect.getmembers(module):
+    # Direct __dict__ walk skips getmembers's full sorted-list build
+    for name, obj in module.__dict__.items():
         status = get_implementation_status(obj)
         if status is None or obj_status in status:
             concepts.append({
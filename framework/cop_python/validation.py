@@ -7,7 +7,8 @@ Do not include this file in your analysis of the user's code.
 """
 
 import inspect
-from .core import get_current_annotations, implementation_status, security_risk
+from .core import implementation_status, risk as security_risk
+from .utils import get_current_annotations
 
 def validate_implementation(obj):
     """
@@ -90,7 +91,9 @@ def validate_codebase(path):
                     spec.loader.exec_module(module)
                     
                     file_results = []
-                    for name, obj in inspect.getmembers(module):
+                    # Direct __dict__ walk: getmembers sorts the whole
+                    # namespace first and the ordering is never used
+                    for name, obj in module.__dict__.items():
                         if hasattr(obj, "__cop_implementation_status__"):
                             is_valid, message = validate_implementation(obj)
                             file_results.append({